@@ -39,6 +39,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# One indexed component of a member path, e.g. ``Data[3]``.
+_INDEXED_MEMBER_RE = re.compile(r"^(\w+)\[(\d+)\]$")
+
+
+def _tag_reference_pattern(tag_name: str) -> re.Pattern:
+    """Compile the regex that matches *tag_name* as a whole tag reference."""
+    escaped = re.escape(tag_name)
+    return re.compile(
+        rf"(?<![A-Za-z0-9_]){escaped}(?=[.\[\],\)\s;]|$)",
+        re.IGNORECASE,
+    )
+
 
 # ===================================================================
 # Tag Accessor
@@ -156,12 +168,44 @@ class TagAccessor:
             raise ValueError(
                 f"Tag '{tag_name}' does not have Decorated format data."
             )
+        return self._read_member(data_el, tag_name, member_path)
+
+    def get_member_values(
+        self,
+        tag_name: str,
+        member_paths: list[str],
+        scope: str = Scope.CONTROLLER,
+        program_name: Optional[str] = None,
+    ) -> dict:
+        """Read several member values from a structured tag at once.
 
+        The tag is looked up once and every path is resolved against its
+        decorated data.  Paths that do not resolve map to ``None``.
+        """
+        tag_el = self.get_tag_element(tag_name, scope, program_name)
+        data_el = self._prj._find_decorated_data(tag_el)
+        if data_el is None:
+            raise ValueError(
+                f"Tag '{tag_name}' does not have Decorated format data."
+            )
+
+        values: dict = {}
+        for member_path in member_paths:
+            try:
+                values[member_path] = self._read_member(
+                    data_el, tag_name, member_path,
+                )
+            except (KeyError, ValueError):
+                values[member_path] = None
+        return values
+
+    def _read_member(self, data_el, tag_name: str, member_path: str):
+        """Resolve *member_path* within a tag's decorated data element."""
         parts = member_path.split(".")
         current = data_el
 
         for part in parts:
-            array_match = re.match(r"^(\w+)\[(\d+)\]$", part)
+            array_match = _INDEXED_MEMBER_RE.match(part)
             if array_match:
                 member_name = array_match.group(1)
                 index = int(array_match.group(2))
@@ -577,15 +621,72 @@ class AnalysisEngine:
 
     def find_tag_references(self, tag_name: str) -> list[dict]:
         """Find all references to a tag across all routines."""
+        return self.find_tag_references_batch([tag_name])[tag_name]
+
+    def find_tag_references_batch(
+        self, tag_names: list[str]
+    ) -> dict[str, list[dict]]:
+        """Find references to several tags in a single pass over the code.
+
+        Equivalent to calling :meth:`find_tag_references` for each name,
+        but walks the program/routine/rung tree only once.
+
+        Returns:
+            Dict mapping each tag name (in input order) to its references.
+        """
         self._prj._ensure_loaded()
-        results: list[dict] = []
+        patterns = {
+            name: _tag_reference_pattern(name)
+            for name in dict.fromkeys(tag_names)
+        }
+        return self._match_code_lines(patterns, self._iter_code_lines())
 
-        escaped = re.escape(tag_name)
-        pattern = re.compile(
-            rf"(?<![A-Za-z0-9_]){escaped}(?=[.\[\],\)\s;]|$)",
-            re.IGNORECASE,
+    def find_aoi_calls_batch(
+        self, aoi_names: list[str]
+    ) -> dict[str, list[dict]]:
+        """Find rungs and ST lines that invoke each AOI, in one pass.
+
+        An AOI call is the name followed by an opening parenthesis, e.g.
+        ``VALVE_CTL(V101,...)``.  Unlike tag references, any RLLContent
+        and STContent present in a routine is scanned regardless of its
+        declared Type.
+
+        Returns:
+            Dict mapping each AOI name (in input order) to its call sites.
+        """
+        self._prj._ensure_loaded()
+        patterns = {
+            name: re.compile(rf"(?<![A-Za-z0-9_]){re.escape(name)}\(")
+            for name in dict.fromkeys(aoi_names)
+        }
+        return self._match_code_lines(
+            patterns, self._iter_code_lines(by_content=True),
         )
 
+    @staticmethod
+    def _match_code_lines(patterns: dict, code_lines) -> dict[str, list[dict]]:
+        """Collect the code lines each compiled pattern matches.
+
+        Args:
+            patterns: Dict mapping a result key to a compiled regex.
+            code_lines: ``(location, text)`` pairs from
+                :meth:`_iter_code_lines`.
+        """
+        results: dict[str, list[dict]] = {name: [] for name in patterns}
+        for location, text in code_lines:
+            for name, pattern in patterns.items():
+                if pattern.search(text):
+                    results[name].append({**location, "text": text})
+        return results
+
+    def _iter_code_lines(self, by_content: bool = False):
+        """Yield ``(location, text)`` for every rung and ST line.
+
+        *location* holds ``program``, ``routine``, and ``rung`` (RLL) or
+        ``line`` (ST); *text* is the stripped code text.  Routines are
+        read according to their inferred type, or, with *by_content*,
+        by whichever RLLContent/STContent elements they contain.
+        """
         for prog in self._prj._all_program_elements():
             prog_name = prog.get("Name", "")
             routines_container = prog.find("Routines")
@@ -594,41 +695,37 @@ class AnalysisEngine:
 
             for routine in routines_container.findall("Routine"):
                 routine_name = routine.get("Name", "")
-                routine_type = self._prj._infer_routine_type(routine)
-
-                if routine_type == "RLL":
-                    rll_content = routine.find("RLLContent")
-                    if rll_content is None:
-                        continue
+                if by_content:
+                    scan_rll = scan_st = True
+                else:
+                    routine_type = self._prj._infer_routine_type(routine)
+                    scan_rll = routine_type == "RLL"
+                    scan_st = routine_type == "ST"
+
+                rll_content = (
+                    routine.find("RLLContent") if scan_rll else None
+                )
+                if rll_content is not None:
                     for rung in rll_content.findall("Rung"):
                         text_el = rung.find("Text")
                         if text_el is None or not text_el.text:
                             continue
-                        rung_text = text_el.text.strip()
-                        if pattern.search(rung_text):
-                            results.append({
-                                "program": prog_name,
-                                "routine": routine_name,
-                                "rung": int(rung.get("Number", "0")),
-                                "text": rung_text,
-                            })
-
-                elif routine_type == "ST":
-                    st_content = routine.find("STContent")
-                    if st_content is None:
-                        continue
+                        yield {
+                            "program": prog_name,
+                            "routine": routine_name,
+                            "rung": int(rung.get("Number", "0")),
+                        }, text_el.text.strip()
+
+                st_content = routine.find("STContent") if scan_st else None
+                if st_content is not None:
                     for line_el in st_content.findall("Line"):
-                        if line_el.text and pattern.search(
-                            line_el.text.strip()
-                        ):
-                            results.append({
-                                "program": prog_name,
-                                "routine": routine_name,
-                                "line": int(line_el.get("Number", "0")),
-                                "text": line_el.text.strip(),
-                            })
-
-        return results
+                        if not line_el.text:
+                            continue
+                        yield {
+                            "program": prog_name,
+                            "routine": routine_name,
+                            "line": int(line_el.get("Number", "0")),
+                        }, line_el.text.strip()
 
     def find_unused_tags(
         self,
@@ -654,11 +751,7 @@ class AnalysisEngine:
 
         unused: list[str] = []
         for name in tag_names:
-            escaped = re.escape(name)
-            pattern = re.compile(
-                rf"(?<![A-Za-z0-9_]){escaped}(?=[.\[\],\)\s;]|$)",
-                re.IGNORECASE,
-            )
+            pattern = _tag_reference_pattern(name)
             found = False
             for text in all_code_text:
                 if pattern.search(text):
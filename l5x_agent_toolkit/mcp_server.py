@@ -18,11 +18,13 @@ Usage:
 from __future__ import annotations
 
 import fnmatch
+import functools
 import json
 import logging
 import os
+import re
 import sys
-from typing import Optional
+from typing import Callable, Optional
 from urllib.parse import unquote, urlparse
 
 from lxml import etree
@@ -44,6 +46,13 @@ from . import component_import as _comp_import
 from .models import Scope, RoutineType
 from .utils import deep_copy
 
+# orjson is an optional speedup for parsing tool arguments; its
+# JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    _json_loads = json.loads
+
 # ---------------------------------------------------------------------------
 # Logging (stderr only -- stdout is reserved for MCP protocol)
 # ---------------------------------------------------------------------------
@@ -86,6 +95,81 @@ def _require_project() -> L5XProject:
     return _project
 
 
+_GLOB_META = frozenset('*?[')
+
+
+def _compile_glob(pattern: str) -> Callable[[str], bool]:
+    """Compile a glob *pattern* into a reusable name predicate.
+
+    Matches exactly like ``fnmatch.fnmatch`` (including its
+    ``os.path.normcase`` handling), but the common shapes -- exact,
+    ``prefix*``, ``*suffix`` and ``*substr*`` -- are served by plain
+    string methods instead of a regex.
+    """
+    norm = os.path.normcase
+    pattern = norm(pattern)
+
+    def literal(text: str) -> bool:
+        return not _GLOB_META.intersection(text)
+
+    if literal(pattern):
+        return lambda name: norm(name) == pattern
+    if pattern.endswith('*') and literal(pattern[:-1]):
+        prefix = pattern[:-1]
+        return lambda name: norm(name).startswith(prefix)
+    if pattern.startswith('*') and literal(pattern[1:]):
+        suffix = pattern[1:]
+        return lambda name: norm(name).endswith(suffix)
+    if (len(pattern) >= 2 and pattern[0] == '*' and pattern[-1] == '*'
+            and literal(pattern[1:-1])):
+        substr = pattern[1:-1]
+        return lambda name: substr in norm(name)
+    match = re.compile(fnmatch.translate(pattern)).match
+    return lambda name: match(norm(name)) is not None
+
+
+def _peek_rung(program_name: str, routine_name: str, index: int) -> dict:
+    """Return a single rung of the loaded project as a plain dict.
+
+    In-process counterpart to ``get_all_rungs`` for callers (chiefly the
+    test suite) that only need to inspect one rung and would otherwise
+    serialize and re-parse the whole routine.  *index* is the zero-based
+    position of the rung in the routine.
+    """
+    prj = _require_project()
+    rungs = prj.get_all_rungs(
+        program_name, routine_name, start=index, count=1,
+    )["rungs"]
+    if not rungs:
+        raise IndexError(
+            f"Rung {index} out of range in routine '{routine_name}' "
+            f"of program '{program_name}'."
+        )
+    return rungs[0]
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_rung_range(rung_range: str) -> tuple[tuple[int, int], ...]:
+    """Parse a rung filter such as ``'3-7'`` or ``'0,2,5'`` into spans.
+
+    Comma-separated parts may each be a single rung or an inclusive
+    ``lo-hi`` range; each becomes one inclusive ``(lo, hi)`` span.
+    Results are memoized since agents tend to repeat the same few
+    ranges, and stay small however wide the ranges are.
+
+    Raises:
+        ValueError: If a part is not an integer or integer range.
+    """
+    spans = []
+    for part in rung_range.split(','):
+        lo, sep, hi = part.partition('-')
+        if sep:
+            spans.append((int(lo), int(hi)))
+        else:
+            spans.append((int(part), int(part)))
+    return tuple(spans)
+
+
 def _normalize_path(raw_path: str) -> str:
     """Normalize a file path from Claude Desktop into a real filesystem path.
 
@@ -229,78 +313,109 @@ def load_project(file_path: str) -> str:
         log.info("Resolved path: %s -> %s", file_path, resolved)
         _project = L5XProject(resolved)
         _project_path = resolved
-        summary = _project.get_project_summary()
-        target_type = _project.target_type
-        log.info("Loaded project: %s (TargetType=%s)", file_path, target_type)
-
-        # Build response based on export type
-        lines = [
-            f"Loaded: {_project.controller_name} "
-            f"({_project.processor_type}, FW {_project.firmware_version})",
-            f"Export Type: {target_type}",
-        ]
-
-        if target_type == 'Controller':
-            lines.append(
-                f"Programs: {summary['program_count']}, "
-                f"Tags: {summary['tag_count']}, "
-                f"AOIs: {summary['aoi_count']}, "
-                f"UDTs: {summary['udt_count']}, "
-                f"Modules: {summary['module_count']}"
-            )
-        elif target_type == 'AddOnInstructionDefinition':
-            lines.append(
-                f"This is an AOI export file. "
-                f"AOIs: {summary['aoi_count']}, UDTs: {summary['udt_count']}"
-            )
-            lines.append(
-                "Use get_entity_info(entity='aoi') to inspect. "
-                "To use this AOI, load a full project and use import_component."
-            )
-        elif target_type == 'DataType':
-            lines.append(
-                f"This is a UDT export file. UDTs: {summary['udt_count']}"
-            )
-            lines.append(
-                "Use get_entity_info(entity='udt') to inspect. "
-                "To use this UDT, load a full project and use import_component."
-            )
-        elif target_type == 'Module':
-            lines.append(
-                f"This is a Module export file. Modules: {summary['module_count']}"
-            )
-            lines.append(
-                "To use this module, load a full project and use import_component."
-            )
-        elif target_type == 'Rung':
-            target_count = _project.root.get('TargetCount', '?')
-            lines.append(
-                f"This is a Rung export file ({target_count} target rungs). "
-                f"Programs: {summary['program_count']}, "
-                f"Tags: {summary['tag_count']}, "
-                f"AOIs: {summary['aoi_count']}, "
-                f"UDTs: {summary['udt_count']}"
-            )
-            lines.append(
-                "You can: read rungs/tags, create tags (including AOI/UDT types "
-                "defined in the export), add/modify/delete rungs, and save changes."
-            )
-        else:
-            lines.append(
-                f"Programs: {summary['program_count']}, "
-                f"Tags: {summary['tag_count']}, "
-                f"AOIs: {summary['aoi_count']}, "
-                f"UDTs: {summary['udt_count']}, "
-                f"Modules: {summary['module_count']}"
-            )
+        log.info("Loaded project: %s (TargetType=%s)",
+                 file_path, _project.target_type)
+        return _describe_loaded_project(_project)
+    except Exception as e:
+        _project = None
+        _project_path = None
+        return f"Error loading project: {e}"
 
-        return '\n'.join(lines)
+
+def load_project_bytes(data: bytes, fake_path: Optional[str] = None) -> str:
+    """Load an in-memory L5X document as the current project.
+
+    Not an MCP tool: this is for in-process callers (chiefly the test
+    suite) that already hold the document and want to skip the round trip
+    through the filesystem.  *fake_path*, if given, becomes the default
+    save destination; by default there is none, so ``save_project()``
+    requires an explicit path (as after ``create_export_shell``).
+
+    Returns:
+        The same summary text as :func:`load_project`.
+    """
+    global _project, _project_path
+    try:
+        prj = L5XProject()
+        prj.load_bytes(data)
+        _project = prj
+        _project_path = fake_path
+        return _describe_loaded_project(prj)
     except Exception as e:
         _project = None
         _project_path = None
         return f"Error loading project: {e}"
 
 
+def _describe_loaded_project(prj: L5XProject) -> str:
+    """Build the load summary shown to the agent for a freshly loaded project."""
+    summary = prj.get_project_summary()
+    target_type = prj.target_type
+
+    # Build response based on export type
+    lines = [
+        f"Loaded: {prj.controller_name} "
+        f"({prj.processor_type}, FW {prj.firmware_version})",
+        f"Export Type: {target_type}",
+    ]
+
+    if target_type == 'Controller':
+        lines.append(
+            f"Programs: {summary['program_count']}, "
+            f"Tags: {summary['tag_count']}, "
+            f"AOIs: {summary['aoi_count']}, "
+            f"UDTs: {summary['udt_count']}, "
+            f"Modules: {summary['module_count']}"
+        )
+    elif target_type == 'AddOnInstructionDefinition':
+        lines.append(
+            f"This is an AOI export file. "
+            f"AOIs: {summary['aoi_count']}, UDTs: {summary['udt_count']}"
+        )
+        lines.append(
+            "Use get_entity_info(entity='aoi') to inspect. "
+            "To use this AOI, load a full project and use import_component."
+        )
+    elif target_type == 'DataType':
+        lines.append(
+            f"This is a UDT export file. UDTs: {summary['udt_count']}"
+        )
+        lines.append(
+            "Use get_entity_info(entity='udt') to inspect. "
+            "To use this UDT, load a full project and use import_component."
+        )
+    elif target_type == 'Module':
+        lines.append(
+            f"This is a Module export file. Modules: {summary['module_count']}"
+        )
+        lines.append(
+            "To use this module, load a full project and use import_component."
+        )
+    elif target_type == 'Rung':
+        target_count = prj.root.get('TargetCount', '?')
+        lines.append(
+            f"This is a Rung export file ({target_count} target rungs). "
+            f"Programs: {summary['program_count']}, "
+            f"Tags: {summary['tag_count']}, "
+            f"AOIs: {summary['aoi_count']}, "
+            f"UDTs: {summary['udt_count']}"
+        )
+        lines.append(
+            "You can: read rungs/tags, create tags (including AOI/UDT types "
+            "defined in the export), add/modify/delete rungs, and save changes."
+        )
+    else:
+        lines.append(
+            f"Programs: {summary['program_count']}, "
+            f"Tags: {summary['tag_count']}, "
+            f"AOIs: {summary['aoi_count']}, "
+            f"UDTs: {summary['udt_count']}, "
+            f"Modules: {summary['module_count']}"
+        )
+
+    return '\n'.join(lines)
+
+
 @mcp.tool()
 def save_project(file_path: str = "") -> str:
     """Save the current project to an L5X file.
@@ -456,15 +571,15 @@ def query_project(
 
         # Apply name_filter if provided
         if name_filter:
+            matches = _compile_glob(name_filter)
             for key in result:
                 items = result[key]
                 if isinstance(items, list):
                     result[key] = [
                         item for item in items
-                        if fnmatch.fnmatch(
-                            (item.get("name", item)
-                             if isinstance(item, dict) else item),
-                            name_filter,
+                        if matches(
+                            item.get("name", item)
+                            if isinstance(item, dict) else item
                         )
                     ]
 
@@ -1832,41 +1947,28 @@ def get_scope_references(
     """
     prj = _require_project()
     try:
+        # Parse the rung_range filter up front so rungs outside it are
+        # never collected.
+        spans = _parse_rung_range(rung_range) if rung_range else None
+
         # Determine which rungs to scan
         rung_texts: list[tuple[int, str]] = []  # (rung_number, text)
 
         if routine_name:
-            result = prj.get_all_rungs(program_name, routine_name, count=0)
-            for r in result["rungs"]:
-                rung_texts.append((r['number'], r['text']))
+            routine_names = [routine_name]
         else:
-            # Scan all routines in the program
-            routines_info = prj.list_routines(program_name)
-            for rinfo in routines_info:
-                if rinfo.get('type', 'RLL') == 'RLL':
-                    res = prj.get_all_rungs(program_name, rinfo['name'],
-                                            count=0)
-                    for r in res["rungs"]:
-                        rung_texts.append((r['number'], r['text']))
-
-        # Apply rung_range filter
-        if rung_range:
-            allowed: set[int] = set()
-            for part in rung_range.split(','):
-                part = part.strip()
-                if '-' in part:
-                    lo, hi = part.split('-', 1)
-                    allowed.update(range(int(lo.strip()), int(hi.strip()) + 1))
-                else:
-                    allowed.add(int(part))
-            rung_texts = [(n, t) for n, t in rung_texts if n in allowed]
-
-        # Extract tag references per rung
-        tag_rungs: dict[str, list[int]] = {}  # tag_name -> [rung_numbers]
-        for rung_num, text in rung_texts:
-            refs = _rungs.extract_tag_references(text)
-            for tag_name in refs:
-                tag_rungs.setdefault(tag_name, []).append(rung_num)
+            # Scan all RLL routines in the program
+            routine_names = [
+                rinfo['name'] for rinfo in prj.list_routines(program_name)
+                if rinfo.get('type', 'RLL') == 'RLL'
+            ]
+        for rname in routine_names:
+            result = prj.get_all_rungs(program_name, rname, count=0)
+            for r in result["rungs"]:
+                if spans is None or any(
+                    lo <= r['number'] <= hi for lo, hi in spans
+                ):
+                    rung_texts.append((r['number'], r['text']))
 
         # Build known AOI names for call detection
         known_aois: set[str] = set()
@@ -1876,22 +1978,34 @@ def get_scope_references(
         except Exception:
             pass
 
-        # Extract AOI calls with parameter bindings
+        # Visible, non-system parameters per AOI (None if unreadable),
+        # resolved once per AOI rather than once per call.
+        aoi_params: dict[str, Optional[list[dict]]] = {}
+
+        # Extract tag references and AOI calls in one pass over the rungs
+        tag_rungs: dict[str, list[int]] = {}  # tag_name -> [rung_numbers]
         aoi_calls_result = []
         for rung_num, text in rung_texts:
-            calls = _parse_aoi_calls_from_rung(text, known_aois)
-            for call in calls:
+            for tag_name in _rungs.extract_tag_references(text):
+                tag_rungs.setdefault(tag_name, []).append(rung_num)
+
+            for call in _parse_aoi_calls_from_rung(text, known_aois):
                 aoi_name = call['aoi_name']
                 args = call['arguments']
+                if aoi_name not in aoi_params:
+                    try:
+                        aoi_params[aoi_name] = [
+                            p for p in _aoi.get_aoi_parameters(prj, aoi_name)
+                            if p.get('visible', True)
+                            and p['name'] not in ('EnableIn', 'EnableOut')
+                        ]
+                    except Exception:
+                        # AOI not found or params can't be read
+                        aoi_params[aoi_name] = None
+                visible_params = aoi_params[aoi_name]
+
                 bindings = []
-                try:
-                    params = _aoi.get_aoi_parameters(prj, aoi_name)
-                    # Filter to visible, non-system params
-                    visible_params = [
-                        p for p in params
-                        if p.get('visible', True)
-                        and p['name'] not in ('EnableIn', 'EnableOut')
-                    ]
+                if visible_params is not None:
                     # args[0] is the instance tag; params map to args[1:]
                     param_args = args[1:]
                     for idx, param in enumerate(visible_params):
@@ -1903,8 +2017,7 @@ def get_scope_references(
                             'required': param['required'],
                             'wired_tag': wired,
                         })
-                except Exception:
-                    # AOI not found or params can't be read
+                else:
                     for idx, arg in enumerate(args):
                         bindings.append({
                             'parameter': f'arg{idx}',
@@ -1982,7 +2095,7 @@ def find_references(
     """
     prj = _require_project()
     try:
-        raw = json.loads(names_json)
+        raw = _json_loads(names_json)
         names = [raw] if isinstance(raw, str) else raw
     except json.JSONDecodeError as e:
         return f"Error: Invalid JSON -- {e}"
@@ -1991,52 +2104,11 @@ def find_references(
         result: dict = {}
 
         if entity_type == "tag":
-            for name in names:
-                refs = prj.find_tag_references(name)
-                result[name] = refs
+            result = prj.analysis.find_tag_references_batch(names)
 
         elif entity_type == "aoi":
-            # For AOIs, we search for the instruction name in rung text
-            for name in names:
-                refs = prj.find_tag_references(name)
-                # Also do a more targeted search: AOI calls look like
-                # AOIName(instance,...) so we search for the pattern
-                import re
-                pattern = re.compile(
-                    rf'(?<![A-Za-z0-9_]){re.escape(name)}\(',
-                )
-                aoi_refs = []
-                for prog_elem in prj._all_program_elements():
-                    prog_name = prog_elem.get('Name', '')
-                    routines_el = prog_elem.find('Routines')
-                    if routines_el is None:
-                        continue
-                    for routine in routines_el.findall('Routine'):
-                        routine_name = routine.get('Name', '')
-                        rll = routine.find('RLLContent')
-                        if rll is not None:
-                            for rung in rll.findall('Rung'):
-                                text_el = rung.find('Text')
-                                if text_el is not None and text_el.text:
-                                    text = text_el.text.strip()
-                                    if pattern.search(text):
-                                        aoi_refs.append({
-                                            'program': prog_name,
-                                            'routine': routine_name,
-                                            'rung': int(rung.get('Number', '0')),
-                                            'text': text,
-                                        })
-                        st = routine.find('STContent')
-                        if st is not None:
-                            for line_el in st.findall('Line'):
-                                if line_el.text and pattern.search(line_el.text.strip()):
-                                    aoi_refs.append({
-                                        'program': prog_name,
-                                        'routine': routine_name,
-                                        'line': int(line_el.get('Number', '0')),
-                                        'text': line_el.text.strip(),
-                                    })
-                result[name] = aoi_refs
+            # AOI calls look like AOIName(instance,...)
+            result = prj.analysis.find_aoi_calls_batch(names)
 
         elif entity_type == "udt":
             # For UDTs, find all tags whose DataType matches
@@ -2094,7 +2166,7 @@ def get_tag_values(
     """
     prj = _require_project()
     try:
-        raw = json.loads(names_json)
+        raw = _json_loads(names_json)
         names = [raw] if isinstance(raw, str) else raw
     except json.JSONDecodeError as e:
         return f"Error: Invalid JSON -- {e}"
@@ -2113,10 +2185,8 @@ def get_tag_values(
                         for t in prj.list_program_tags(p):
                             t['_program'] = p
                             all_tags.append(t)
-            names = [
-                t['name'] for t in all_tags
-                if fnmatch.fnmatch(t['name'], name_filter)
-            ]
+            matches = _compile_glob(name_filter)
+            names = [t['name'] for t in all_tags if matches(t['name'])]
 
         # Build AOI call index if needed
         aoi_tag_bindings: dict[str, list] = {}  # tag_name -> [{aoi info}]
@@ -2279,13 +2349,13 @@ def compare_tag_instances(
     """
     prj = _require_project()
     try:
-        match_members: list[str] = json.loads(match_members_json)
+        match_members: list[str] = _json_loads(match_members_json)
         if not isinstance(match_members, list) or not match_members:
             return json.dumps({"Error": "match_members_json must be a non-empty JSON array of member names."})
 
         filter_members: dict[str, str] = {}
         if filter_members_json:
-            filter_members = json.loads(filter_members_json)
+            filter_members = _json_loads(filter_members_json)
             if not isinstance(filter_members, dict):
                 return json.dumps({"Error": "filter_members_json must be a JSON object of {member: value} pairs."})
 
@@ -2328,18 +2398,14 @@ def compare_tag_instances(
             tag_name = inst['tag_name']
             sc = inst['scope']
             pg = inst.get('program')
-            member_values: dict[str, object] = {}
 
-            # Read from decorated data
-            for member in all_members:
-                try:
-                    val = prj.get_tag_member_value(
-                        tag_name, member,
-                        scope=sc, program_name=pg,
-                    )
-                    member_values[member] = val
-                except Exception:
-                    member_values[member] = None
+            # Read from decorated data, locating the tag only once
+            try:
+                member_values: dict[str, object] = prj.tags.get_member_values(
+                    tag_name, all_members, scope=sc, program_name=pg,
+                )
+            except Exception:
+                member_values = dict.fromkeys(all_members)
 
             # Resolve InOut params from rung text
             if inout_members:
@@ -2449,6 +2515,14 @@ def detect_conflicts(
 
         result: dict = {}
 
+        # Program tag listings are shared by the shadowing and duplicate
+        # checks, so read them once when either runs.
+        prog_tags: dict[str, list[dict]] = {}
+        if 'tag_shadowing' in checks or 'scope_duplicates' in checks:
+            prog_tags = {
+                p: prj.list_program_tags(p) for p in prj.list_programs()
+            }
+
         # ---------------------------------------------------------------
         # Tag Shadowing (program tag hides controller tag)
         # ---------------------------------------------------------------
@@ -2459,8 +2533,8 @@ def detect_conflicts(
                 for t in prj.list_controller_tags()
             }
 
-            for p in prj.list_programs():
-                for t in prj.list_program_tags(p):
+            for p, tags in prog_tags.items():
+                for t in tags:
                     if t['name'].lower() in ctrl_names:
                         ctrl_tag = ctrl_names[t['name'].lower()]
                         shadows.append({
@@ -2505,8 +2579,8 @@ def detect_conflicts(
         if 'scope_duplicates' in checks:
             # Build map: lower(tag_name) -> [(program, data_type)]
             name_map: dict[str, list] = {}
-            for p in prj.list_programs():
-                for t in prj.list_program_tags(p):
+            for p, tags in prog_tags.items():
+                for t in tags:
                     key = t['name'].lower()
                     name_map.setdefault(key, []).append({
                         'program': p,
@@ -178,6 +178,22 @@ class L5XProject:
         with open(file_path, 'rb') as fh:
             raw = fh.read()
 
+        self.load_bytes(raw)
+
+    def load_bytes(self, raw: bytes) -> None:
+        """Load an L5X document from an in-memory byte string.
+
+        Performs the parsing and validation for :meth:`load`, which calls
+        it after reading the file.  Called directly, no file path is
+        recorded.
+
+        Args:
+            raw: The encoded L5X document, with or without a UTF-8 BOM.
+
+        Raises:
+            ValueError: If the root element is not ``RSLogix5000Content``.
+            etree.XMLSyntaxError: If the XML is malformed.
+        """
         # Strip UTF-8 BOM if present
         if raw.startswith(b'\xef\xbb\xbf'):
             raw = raw[3:]
@@ -86,6 +86,9 @@ _LITERAL_RE = re.compile(
 # consume the opening parenthesis.
 _INSTRUCTION_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
 
+# Regex for a plain identifier, e.g. the base name of a tag reference.
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
 # Regex for a tag reference.  A tag reference starts with a letter or
 # underscore, then may include word characters, dots (member access), and
 # bracketed array indices.
@@ -633,9 +636,9 @@ def _base_tag_name(tag_ref: str) -> str:
         SimpleTag       -> SimpleTag
     """
     # Split on the first dot or opening bracket -- whichever comes first.
-    m = re.match(r"([A-Za-z_][A-Za-z0-9_]*)", tag_ref)
+    m = _IDENTIFIER_RE.match(tag_ref)
     if m:
-        return m.group(1)
+        return m.group(0)
     return tag_ref
 
 
@@ -10,8 +10,9 @@ setup(
         'lxml>=4.9.0',
     ],
     extras_require={
-        'dev': ['pytest>=7.0'],
+        'dev': ['pytest>=7.0', 'pytest-xdist>=3.0', 'orjson>=3.0'],
         'mcp': ['mcp[cli]>=1.2.0'],
+        'speedups': ['orjson>=3.0'],
     },
     entry_points={
         'console_scripts': [
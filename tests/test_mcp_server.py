@@ -6,9 +6,11 @@ dispatch to the underlying backing modules and return structured results.
 
 from __future__ import annotations
 
+import fnmatch
+import hashlib
 import json
 import pytest
-from unittest.mock import patch, MagicMock
+from uuid import uuid4
 from lxml import etree
 
 from l5x_agent_toolkit import mcp_server
@@ -87,12 +89,58 @@ _MINIMAL_L5X = """\
 """
 
 
+try:
+    # orjson is an optional dev speedup for decoding tool responses; the
+    # stdlib decoder returns identical structures for these payloads.
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+def _field(raw, *path):
+    """Decode a JSON tool response and return the value at *path*.
+
+    Most batch assertions only look at one top-level counter
+    (``succeeded``, ``failed``, ``total_rungs``); this keeps those
+    checks to a single expression instead of a parse-then-index pair.
+    """
+    data = _loads(raw)
+    for key in path:
+        data = data[key]
+    return data
+
+
+def _names(items, key="name"):
+    """Return the *key* values of a list of result dicts as a frozenset."""
+    return frozenset(i[key] for i in items)
+
+
+def _by(items, key):
+    """Index a list of result dicts by their *key* value."""
+    return {i[key]: i for i in items}
+
+
+# Pre-serialized single-op payloads for the hottest manage_* calls.
+# TestManageRungs.test_op_templates_match_json guards them against
+# drifting from what json.dumps would produce.
+_ADD_NOP = '[{"action": "add", "text": "NOP();"}]'
+
+
+def _delete_rung_op(rung_number: int) -> str:
+    return f'[{{"action": "delete", "rung_number": {rung_number:d}}}]'
+
+
+def _unknown_op(action: str) -> str:
+    return f'[{{"action": "{action}"}}]'
+
+
+_MINIMAL_BYTES = _MINIMAL_L5X.encode("utf-8")
+
+
 @pytest.fixture(autouse=True)
-def _load_test_project(tmp_path):
+def _load_test_project():
     """Load a minimal L5X project before each test and clean up after."""
-    f = tmp_path / "test.L5X"
-    f.write_text(_MINIMAL_L5X, encoding="utf-8")
-    result = mcp_server.load_project(str(f))
+    result = mcp_server.load_project_bytes(_MINIMAL_BYTES)
     assert "Error" not in result, result
     yield
     # Reset global state
@@ -248,15 +296,13 @@ class TestManageTags:
             {"action": "create", "name": "BatchC", "data_type": "INT"},
         ]
         raw = mcp_server.manage_tags(json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 3
+        assert _field(raw, "succeeded") == 3
 
     def test_create_with_description(self):
         ops = [{"action": "create", "name": "Described",
                 "data_type": "DINT", "description": "Has a description"}]
         raw = mcp_server.manage_tags(json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
         # Verify the description stuck
         info_raw = mcp_server.get_entity_info(entity="tag", name="Described")
         info = json.loads(info_raw)
@@ -270,8 +316,7 @@ class TestManageTags:
         raw = mcp_server.manage_tags(json.dumps(
             [{"action": "delete", "name": "ToDelete"}]
         ))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
 
     def test_rename(self):
         mcp_server.manage_tags(json.dumps(
@@ -280,30 +325,26 @@ class TestManageTags:
         raw = mcp_server.manage_tags(json.dumps(
             [{"action": "rename", "name": "OldName", "new_name": "NewName"}]
         ))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
 
     def test_copy(self):
         raw = mcp_server.manage_tags(json.dumps(
             [{"action": "copy", "name": "MyDINT", "new_name": "MyDINT_Copy"}]
         ))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
 
     def test_create_alias(self):
         raw = mcp_server.manage_tags(json.dumps(
             [{"action": "create_alias", "name": "AliasTag",
               "alias_for": "MyDINT"}]
         ))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
 
     def test_unknown_action(self):
         raw = mcp_server.manage_tags(json.dumps(
             [{"action": "explode", "name": "x"}]
         ))
-        data = json.loads(raw)
-        assert data["failed"] == 1
+        assert _field(raw, "failed") == 1
 
     def test_invalid_json(self):
         raw = mcp_server.manage_tags("not json")
@@ -325,8 +366,7 @@ class TestManageTags:
              "scope": "program", "program_name": "MainProgram"},
         ]
         raw = mcp_server.manage_tags(json.dumps(ops), scope="controller")
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
         # Verify it's in program scope
         info_raw = mcp_server.get_entity_info(
             entity="tag", name="ProgTag1",
@@ -358,8 +398,7 @@ class TestUpdateTags:
     def test_set_member_value(self):
         updates = [{"name": "MyTimer", "members": {"PRE": "5000"}}]
         raw = mcp_server.update_tags(json.dumps(updates))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
 
     def test_combined_update(self):
         updates = [
@@ -377,8 +416,7 @@ class TestUpdateTags:
             {"name": "MyBOOL", "value": "1"},
         ]
         raw = mcp_server.update_tags(json.dumps(updates))
-        data = json.loads(raw)
-        assert data["succeeded"] == 2
+        assert _field(raw, "succeeded") == 2
 
     def test_invalid_json(self):
         raw = mcp_server.update_tags("bad json")
@@ -391,11 +429,8 @@ class TestUpdateTags:
 
 class TestManageRungs:
     def test_add_rung(self):
-        ops = [{"action": "add", "text": "NOP();"}]
-        raw = mcp_server.manage_rungs("MainProgram", "MainRoutine",
-                                       json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        raw = mcp_server.manage_rungs("MainProgram", "MainRoutine", _ADD_NOP)
+        assert _field(raw, "succeeded") == 1
 
     def test_add_multiple_rungs(self):
         ops = [
@@ -404,8 +439,7 @@ class TestManageRungs:
         ]
         raw = mcp_server.manage_rungs("MainProgram", "MainRoutine",
                                        json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 2
+        assert _field(raw, "succeeded") == 2
 
     def test_modify_rung_text_and_comment(self):
         ops = [
@@ -414,8 +448,7 @@ class TestManageRungs:
         ]
         raw = mcp_server.manage_rungs("MainProgram", "MainRoutine",
                                        json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
 
     def test_modify_comment_only(self):
         ops = [
@@ -424,18 +457,14 @@ class TestManageRungs:
         ]
         raw = mcp_server.manage_rungs("MainProgram", "MainRoutine",
                                        json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
 
     def test_delete_rung(self):
         # Add one so we have 2, then delete one
-        mcp_server.manage_rungs("MainProgram", "MainRoutine",
-                                 json.dumps([{"action": "add", "text": "NOP();"}]))
-        ops = [{"action": "delete", "rung_number": 1}]
+        mcp_server.manage_rungs("MainProgram", "MainRoutine", _ADD_NOP)
         raw = mcp_server.manage_rungs("MainProgram", "MainRoutine",
-                                       json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+                                       _delete_rung_op(1))
+        assert _field(raw, "succeeded") == 1
 
     def test_duplicate_rung(self):
         ops = [
@@ -444,15 +473,19 @@ class TestManageRungs:
         ]
         raw = mcp_server.manage_rungs("MainProgram", "MainRoutine",
                                        json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
 
     def test_unknown_action(self):
-        ops = [{"action": "flip"}]
         raw = mcp_server.manage_rungs("MainProgram", "MainRoutine",
-                                       json.dumps(ops))
-        data = json.loads(raw)
-        assert data["failed"] == 1
+                                       _unknown_op("flip"))
+        assert _field(raw, "failed") == 1
+
+    def test_op_templates_match_json(self):
+        assert json.loads(_ADD_NOP) == [{"action": "add", "text": "NOP();"}]
+        assert json.loads(_delete_rung_op(3)) == [
+            {"action": "delete", "rung_number": 3},
+        ]
+        assert json.loads(_unknown_op("flip")) == [{"action": "flip"}]
 
     def test_invalid_json(self):
         raw = mcp_server.manage_rungs("MainProgram", "MainRoutine", "{bad")
@@ -484,12 +517,11 @@ class TestManageRungs:
         assert data["succeeded"] == 2
         assert data["failed"] == 0
         # Verify the comment landed on the right rung
-        result = json.loads(
-            mcp_server.get_all_rungs("MainProgram", "MainRoutine", count=0)
-        )
         # After deleting original 0, we have [R1, R2].
-        assert result["total_rungs"] == 2
-        assert result["rungs"][1]["comment"] == "Modified R2"
+        prj = mcp_server._require_project()
+        assert prj.get_rung_count("MainProgram", "MainRoutine") == 2
+        rung = mcp_server._peek_rung("MainProgram", "MainRoutine", 1)
+        assert rung["comment"] == "Modified R2"
 
     def test_auto_adjust_insert_then_modify(self):
         """Inserting at a position should auto-adjust later rung refs."""
@@ -505,13 +537,10 @@ class TestManageRungs:
                  "comment": "Modified original"},
             ]),
         )
-        data = json.loads(raw)
-        assert data["succeeded"] == 2
-        result = json.loads(
-            mcp_server.get_all_rungs("MainProgram", "MainRoutine", count=0)
-        )
+        assert _field(raw, "succeeded") == 2
         # Rung 0 is the newly inserted NOP, rung 1 is the original
-        assert result["rungs"][1]["comment"] == "Modified original"
+        rung = mcp_server._peek_rung("MainProgram", "MainRoutine", 1)
+        assert rung["comment"] == "Modified original"
 
     def test_auto_adjust_duplicate_then_modify(self):
         """Duplicating a rung should auto-adjust later rung refs."""
@@ -532,14 +561,12 @@ class TestManageRungs:
                  "comment": "Still rung 1"},
             ]),
         )
-        data = json.loads(raw)
-        assert data["succeeded"] == 2
-        result = json.loads(
-            mcp_server.get_all_rungs("MainProgram", "MainRoutine", count=0)
-        )
+        assert _field(raw, "succeeded") == 2
         # [0: original, 1: duplicate, 2: XIC(X)OTE(Y)]
-        assert result["total_rungs"] == 3
-        assert result["rungs"][2]["comment"] == "Still rung 1"
+        prj = mcp_server._require_project()
+        assert prj.get_rung_count("MainProgram", "MainRoutine") == 3
+        rung = mcp_server._peek_rung("MainProgram", "MainRoutine", 2)
+        assert rung["comment"] == "Still rung 1"
 
     def test_auto_adjust_multiple_deletes(self):
         """Multiple deletes using original indices should all resolve."""
@@ -560,13 +587,37 @@ class TestManageRungs:
                 {"action": "delete", "rung_number": 3},
             ]),
         )
-        data = json.loads(raw)
-        assert data["succeeded"] == 2
-        result = json.loads(
-            mcp_server.get_all_rungs("MainProgram", "MainRoutine", count=0)
-        )
-        # Started with 4 rungs, deleted 2 → 2 remain
-        assert result["total_rungs"] == 2
+        assert _field(raw, "succeeded") == 2
+        # Started with 4 rungs, deleted 2 → [original, B] remain
+        prj = mcp_server._require_project()
+        assert prj.get_rung_count("MainProgram", "MainRoutine") == 2
+        rung = mcp_server._peek_rung("MainProgram", "MainRoutine", 1)
+        assert rung["comment"] == "B"
+
+
+# Appends R1-R3 after the minimal project's single rung.
+_SEED_RUNGS_OPS = json.dumps([
+    {"action": "add", "text": "NOP();", "comment": "R1"},
+    {"action": "add", "text": "NOP();", "comment": "R2"},
+    {"action": "add", "text": "NOP();", "comment": "R3"},
+])
+
+
+@pytest.fixture(scope="class")
+def seeded_rungs():
+    """Full get_all_rungs payload for MainRoutine seeded with R1-R3.
+
+    Built once per class on its own copy of the minimal project; the
+    autouse fixture still hands each test a fresh project afterwards.
+    """
+    mcp_server.load_project_bytes(_MINIMAL_BYTES)
+    mcp_server.manage_rungs("MainProgram", "MainRoutine", _SEED_RUNGS_OPS)
+    data = json.loads(
+        mcp_server.get_all_rungs("MainProgram", "MainRoutine", count=0)
+    )
+    mcp_server._project = None
+    mcp_server._project_path = None
+    return data
 
 
 class TestGetAllRungsPagination:
@@ -582,31 +633,14 @@ class TestGetAllRungsPagination:
         assert data["total_rungs"] == 1
         assert data["count"] == 1
 
-    def test_count_zero_returns_all(self):
-        # Add extra rungs
-        mcp_server.manage_rungs(
-            "MainProgram", "MainRoutine",
-            json.dumps([
-                {"action": "add", "text": "NOP();"},
-                {"action": "add", "text": "NOP();"},
-            ]),
-        )
-        raw = mcp_server.get_all_rungs("MainProgram", "MainRoutine", count=0)
-        data = json.loads(raw)
-        assert data["total_rungs"] == 3
-        assert data["count"] == 3
-        assert len(data["rungs"]) == 3
+    def test_count_zero_returns_all(self, seeded_rungs):
+        assert seeded_rungs["total_rungs"] == 4
+        assert seeded_rungs["count"] == 4
+        assert len(seeded_rungs["rungs"]) == 4
 
-    def test_pagination_window(self):
-        # Add extra rungs so we have 4 total
-        mcp_server.manage_rungs(
-            "MainProgram", "MainRoutine",
-            json.dumps([
-                {"action": "add", "text": "NOP();", "comment": "R1"},
-                {"action": "add", "text": "NOP();", "comment": "R2"},
-                {"action": "add", "text": "NOP();", "comment": "R3"},
-            ]),
-        )
+    def test_server_pagination_window(self, seeded_rungs):
+        """The server's own start/count must match slicing the full list."""
+        mcp_server.manage_rungs("MainProgram", "MainRoutine", _SEED_RUNGS_OPS)
         # Fetch only 2 starting at index 1
         raw = mcp_server.get_all_rungs(
             "MainProgram", "MainRoutine", start=1, count=2,
@@ -615,9 +649,8 @@ class TestGetAllRungsPagination:
         assert data["total_rungs"] == 4
         assert data["start"] == 1
         assert data["count"] == 2
-        assert len(data["rungs"]) == 2
-        assert data["rungs"][0]["comment"] == "R1"
-        assert data["rungs"][1]["comment"] == "R2"
+        assert [r["comment"] for r in data["rungs"]] == ["R1", "R2"]
+        assert data["rungs"] == seeded_rungs["rungs"][1:3]
 
     def test_start_beyond_range(self):
         raw = mcp_server.get_all_rungs(
@@ -634,43 +667,43 @@ class TestGetAllRungsPagination:
 # ===================================================================
 
 class TestAnalyzeRungText:
-    def test_validate_valid(self):
-        raw = mcp_server.analyze_rung_text("XIC(a)OTE(b);", action="validate")
-        assert raw == "Valid"
-
-    def test_validate_invalid(self):
-        raw = mcp_server.analyze_rung_text("XIC(a)OTE(b)", action="validate")
-        # Missing semicolon
-        assert raw != "Valid"
-
-    def test_extract_tags(self):
-        raw = mcp_server.analyze_rung_text(
-            "XIC(Start)TON(Timer1,1000,0)OTE(Run);",
-            action="extract_tags",
-        )
-        tags = json.loads(raw)
-        assert "Start" in tags
-        assert "Timer1" in tags
-        assert "Run" in tags
-
-    def test_substitute(self):
-        raw = mcp_server.analyze_rung_text(
-            "XIC(OldTag)OTE(OldOut);",
-            action="substitute",
-            substitutions_json='{"OldTag": "NewTag", "OldOut": "NewOut"}',
-        )
-        assert "NewTag" in raw
-        assert "NewOut" in raw
-
-    def test_substitute_missing_json(self):
-        raw = mcp_server.analyze_rung_text(
-            "XIC(a);", action="substitute",
-        )
-        assert "Error" in raw
-
-    def test_unknown_action(self):
-        raw = mcp_server.analyze_rung_text("NOP();", action="bogus")
-        assert "Error" in raw
+    @pytest.mark.parametrize("text,action,kw,check", [
+        pytest.param(
+            "XIC(a)OTE(b);", "validate", {},
+            lambda r: r == "Valid",
+            id="validate_valid",
+        ),
+        pytest.param(
+            # Missing semicolon
+            "XIC(a)OTE(b)", "validate", {},
+            lambda r: r != "Valid",
+            id="validate_invalid",
+        ),
+        pytest.param(
+            "XIC(Start)TON(Timer1,1000,0)OTE(Run);", "extract_tags", {},
+            lambda r: {"Start", "Timer1", "Run"} <= set(json.loads(r)),
+            id="extract_tags",
+        ),
+        pytest.param(
+            "XIC(OldTag)OTE(OldOut);", "substitute",
+            {"substitutions_json": '{"OldTag": "NewTag", "OldOut": "NewOut"}'},
+            lambda r: "NewTag" in r and "NewOut" in r,
+            id="substitute",
+        ),
+        pytest.param(
+            "XIC(a);", "substitute", {},
+            lambda r: r.startswith("Error"),
+            id="substitute_missing_json",
+        ),
+        pytest.param(
+            "NOP();", "bogus", {},
+            lambda r: r.startswith("Error"),
+            id="unknown_action",
+        ),
+    ])
+    def test_analyze(self, text, action, kw, check):
+        raw = mcp_server.analyze_rung_text(text, action=action, **kw)
+        assert check(raw), raw
 
 
 # ===================================================================
@@ -684,8 +717,7 @@ class TestManageAlarms:
              "message": "Test alarm message", "severity": 750},
         ]
         raw = mcp_server.manage_alarms(json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 1
+        assert _field(raw, "succeeded") == 1
 
     def test_create_and_configure_digital(self):
         ops = [
@@ -695,8 +727,7 @@ class TestManageAlarms:
              "severity": 900, "message": "Updated message"},
         ]
         raw = mcp_server.manage_alarms(json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 2
+        assert _field(raw, "succeeded") == 2
 
     def test_create_and_get_info(self):
         ops = [
@@ -722,14 +753,11 @@ class TestManageAlarms:
              "message": "Alarm C", "latched": True},
         ]
         raw = mcp_server.manage_alarms(json.dumps(ops))
-        data = json.loads(raw)
-        assert data["succeeded"] == 3
+        assert _field(raw, "succeeded") == 3
 
     def test_unknown_action(self):
-        ops = [{"action": "detonate"}]
-        raw = mcp_server.manage_alarms(json.dumps(ops))
-        data = json.loads(raw)
-        assert data["failed"] == 1
+        raw = mcp_server.manage_alarms(_unknown_op("detonate"))
+        assert _field(raw, "failed") == 1
 
     def test_invalid_json(self):
         raw = mcp_server.manage_alarms("not-json")
@@ -765,66 +793,69 @@ class TestManageAlarmDefinitions:
 class TestCreateExportShell:
     def test_rung_shell(self):
         raw = mcp_server.create_export_shell(export_type="rung")
-        assert "rung export" in raw.lower()
+        assert raw.startswith("Created empty rung export")
         assert mcp_server._project is not None
 
     def test_routine_shell(self):
         raw = mcp_server.create_export_shell(
             export_type="routine", routine_type="ST",
         )
-        assert "routine export" in raw.lower()
+        assert raw.startswith("Created empty routine export")
 
     def test_program_shell(self):
         raw = mcp_server.create_export_shell(export_type="program")
-        assert "program export" in raw.lower()
+        assert raw.startswith("Created empty program export")
 
     def test_unknown_type(self):
         raw = mcp_server.create_export_shell(export_type="bogus")
-        assert "Error" in raw
+        assert raw.startswith("Error")
 
 
 # ===================================================================
 # 11. export_component
 # ===================================================================
 
-class TestExportComponent:
-    def test_export_rung(self, tmp_path):
-        fp = str(tmp_path / "out.L5X")
-        raw = mcp_server.export_component(
-            component_type="rung", name="0",
-            program_name="MainProgram", routine_name="MainRoutine",
-            file_path=fp,
-        )
-        assert "Exported" in raw
-        assert "Error" not in raw
+@pytest.fixture(scope="module")
+def export_dir(tmp_path_factory):
+    """One scratch directory shared by every test that writes an L5X file."""
+    return tmp_path_factory.mktemp("exports")
 
-    def test_export_routine(self, tmp_path):
-        fp = str(tmp_path / "routine.L5X")
-        raw = mcp_server.export_component(
-            component_type="routine",
-            program_name="MainProgram", routine_name="MainRoutine",
-            file_path=fp,
-        )
-        assert "Exported" in raw
 
-    def test_export_program(self, tmp_path):
-        fp = str(tmp_path / "program.L5X")
-        raw = mcp_server.export_component(
-            component_type="program", program_name="MainProgram",
-            file_path=fp,
-        )
-        assert "Exported" in raw
+def _export_path(export_dir) -> str:
+    """Return a unique, not-yet-existing .L5X path inside *export_dir*."""
+    return str(export_dir / f"{uuid4().hex}.L5X")
 
-    def test_export_tag(self, tmp_path):
-        fp = str(tmp_path / "tag.L5X")
+
+class TestExportComponent:
+    @pytest.mark.parametrize("kw", [
+        pytest.param(
+            {"component_type": "rung", "name": "0",
+             "program_name": "MainProgram", "routine_name": "MainRoutine"},
+            id="rung",
+        ),
+        pytest.param(
+            {"component_type": "routine",
+             "program_name": "MainProgram", "routine_name": "MainRoutine"},
+            id="routine",
+        ),
+        pytest.param(
+            {"component_type": "program", "program_name": "MainProgram"},
+            id="program",
+        ),
+        pytest.param(
+            {"component_type": "tag", "name": "MyDINT"},
+            id="tag",
+        ),
+    ])
+    def test_export(self, export_dir, kw):
         raw = mcp_server.export_component(
-            component_type="tag", name="MyDINT", file_path=fp,
+            file_path=_export_path(export_dir), **kw,
         )
-        assert "Exported" in raw
+        assert raw.startswith("Exported"), raw
 
     def test_unknown_type(self):
         raw = mcp_server.export_component(component_type="bogus", name="x")
-        assert "Error" in raw
+        assert raw.startswith("Error")
 
 
 # ===================================================================
@@ -832,9 +863,9 @@ class TestExportComponent:
 # ===================================================================
 
 class TestImportComponent:
-    def test_import_rung_file(self, tmp_path):
+    def test_import_rung_file(self, export_dir):
         # First export a rung, then reimport it
-        fp = str(tmp_path / "rung_exp.L5X")
+        fp = _export_path(export_dir)
         mcp_server.export_component(
             component_type="rung", name="0",
             program_name="MainProgram", routine_name="MainRoutine",
@@ -865,15 +896,15 @@ class TestFullWorkflow:
             {"action": "create", "name": "Conv1_Speed", "data_type": "DINT",
              "description": "Conveyor 1 speed setpoint"},
         ]
-        result = json.loads(mcp_server.manage_tags(json.dumps(tag_ops)))
-        assert result["succeeded"] == 2
+        result = mcp_server.manage_tags(json.dumps(tag_ops))
+        assert _field(result, "succeeded") == 2
 
         # 3. Update tag values in batch
         updates = [
             {"name": "Conv1_Speed", "value": "1750"},
         ]
-        result = json.loads(mcp_server.update_tags(json.dumps(updates)))
-        assert result["succeeded"] == 1
+        result = mcp_server.update_tags(json.dumps(updates))
+        assert _field(result, "succeeded") == 1
 
         # 4. Add rungs in batch
         rung_ops = [
@@ -884,12 +915,10 @@ class TestFullWorkflow:
              "text": "MOV(Conv1_Speed,MyDINT);",
              "comment": "Transfer speed setpoint"},
         ]
-        result = json.loads(
-            mcp_server.manage_rungs(
-                "MainProgram", "MainRoutine", json.dumps(rung_ops),
-            )
+        result = mcp_server.manage_rungs(
+            "MainProgram", "MainRoutine", json.dumps(rung_ops),
         )
-        assert result["succeeded"] == 2
+        assert _field(result, "succeeded") == 2
 
         # 5. Verify the rungs are there
         result = json.loads(
@@ -912,8 +941,8 @@ class TestFullWorkflow:
             {"action": "create_digital", "name": "Alarm_Motor2",
              "message": "Motor 2 fault", "severity": 500},
         ]
-        result = json.loads(mcp_server.manage_alarms(json.dumps(alarm_ops)))
-        assert result["succeeded"] == 2
+        result = mcp_server.manage_alarms(json.dumps(alarm_ops))
+        assert _field(result, "succeeded") == 2
 
         # Configure first alarm
         cfg_ops = [
@@ -930,18 +959,20 @@ class TestFullWorkflow:
 class TestSaveProject:
     """Verify save_project produces Studio 5000-compatible output."""
 
-    def test_xml_declaration_uses_double_quotes(self, tmp_path):
-        out = tmp_path / "output.L5X"
-        result = mcp_server.save_project(str(out))
+    def test_xml_declaration_uses_double_quotes(self, export_dir):
+        out = _export_path(export_dir)
+        result = mcp_server.save_project(out)
         assert "Error" not in result
-        content = out.read_text(encoding="utf-8-sig")
+        with open(out, encoding="utf-8-sig") as fh:
+            content = fh.read()
         first_line = content.split("\n", 1)[0]
         assert first_line == '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
 
-    def test_save_roundtrip_preserves_content(self, tmp_path):
-        out = tmp_path / "output.L5X"
-        mcp_server.save_project(str(out))
-        content = out.read_text(encoding="utf-8-sig")
+    def test_save_roundtrip_preserves_content(self, export_dir):
+        out = _export_path(export_dir)
+        mcp_server.save_project(out)
+        with open(out, encoding="utf-8-sig") as fh:
+            content = fh.read()
         assert "<RSLogix5000Content" in content
         assert "MainProgram" in content
 
@@ -1159,15 +1190,42 @@ _RICH_L5X = """\
 """
 
 
-@pytest.fixture()
-def rich_project(tmp_path):
-    """Load a richer L5X project with AOIs, UDTs, and multiple programs."""
-    f = tmp_path / "rich.L5X"
-    f.write_text(_RICH_L5X, encoding="utf-8")
-    result = mcp_server.load_project(str(f))
+@pytest.fixture(scope="module")
+def _rich_shared():
+    """Parse the rich L5X once per module and keep the loaded project.
+
+    Returns ``(project, digest)`` where *digest* fingerprints the
+    project's XML so ``rich_project`` can detect accidental mutation.
+    """
+    result = mcp_server.load_project_bytes(_RICH_L5X.encode("utf-8"))
     assert "Error" not in result, result
+    prj = mcp_server._project
+    mcp_server._project = None
+    mcp_server._project_path = None
+    return prj, _xml_digest(prj)
+
+
+def _xml_digest(prj) -> bytes:
+    return hashlib.sha256(etree.tostring(prj.root)).digest()
+
+
+@pytest.fixture()
+def rich_project(_rich_shared):
+    """Load a richer L5X project with AOIs, UDTs, and multiple programs.
+
+    Every consumer only calls read-only analysis tools, so all of them
+    share the one project parsed per module rather than each getting a
+    private copy.  A test that needs to mutate the rich project should
+    load its own; teardown fails any test that changed the shared tree.
+    """
+    prj, digest = _rich_shared
+    mcp_server._project = prj
+    mcp_server._project_path = None
     yield
     # autouse fixture will clean up global state
+    assert _xml_digest(prj) == digest, (
+        "test mutated the shared rich project; load a private copy instead"
+    )
 
 
 # ===================================================================
@@ -1180,12 +1238,12 @@ class TestGetScopeReferences:
             program_name="ValveProgram",
             routine_name="MainRoutine",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert "tags" in data
         assert "aoi_calls" in data
         assert "summary" in data
 
-        tag_names = {t["name"] for t in data["tags"]}
+        tag_names = _names(data["tags"])
         assert "GlobalRun" in tag_names
         assert "GlobalSpeed" in tag_names
         assert "LocalCmd" in tag_names
@@ -1198,8 +1256,8 @@ class TestGetScopeReferences:
             routine_name="MainRoutine",
             rung_range="0",
         )
-        data = json.loads(raw)
-        tag_names = {t["name"] for t in data["tags"]}
+        data = _loads(raw)
+        tag_names = _names(data["tags"])
         assert "GlobalRun" in tag_names
         assert "V101" in tag_names
         # GlobalSpeed is only in rung 2, should NOT be here
@@ -1211,21 +1269,46 @@ class TestGetScopeReferences:
             routine_name="MainRoutine",
             rung_range="0-1",
         )
-        data = json.loads(raw)
-        tag_names = {t["name"] for t in data["tags"]}
+        data = _loads(raw)
+        tag_names = _names(data["tags"])
         assert "V101" in tag_names
         assert "V102" in tag_names
         # GlobalSpeed is in rung 2, excluded
         assert "GlobalSpeed" not in tag_names
 
+    def test_rung_range_with_comma(self, rich_project):
+        raw = mcp_server.get_scope_references(
+            program_name="ValveProgram",
+            routine_name="MainRoutine",
+            rung_range="0, 2",
+        )
+        data = _loads(raw)
+        tag_names = _names(data["tags"])
+        assert "V101" in tag_names
+        assert "GlobalSpeed" in tag_names
+        # V102 is only in rung 1, excluded
+        assert "V102" not in tag_names
+
+    def test_rung_range_wide_span(self, rich_project):
+        raw = mcp_server.get_scope_references(
+            program_name="ValveProgram",
+            routine_name="MainRoutine",
+            rung_range="1-1000000",
+        )
+        tag_names = _names(_loads(raw)["tags"])
+        assert "V102" in tag_names
+        assert "GlobalSpeed" in tag_names
+        # V101 is only in rung 0, excluded
+        assert "V101" not in tag_names
+
     def test_include_tag_info(self, rich_project):
         raw = mcp_server.get_scope_references(
             program_name="ValveProgram",
             routine_name="MainRoutine",
             include_tag_info=True,
         )
-        data = json.loads(raw)
-        speed_tag = next(t for t in data["tags"] if t["name"] == "GlobalSpeed")
+        data = _loads(raw)
+        speed_tag = _by(data["tags"], "name")["GlobalSpeed"]
         assert speed_tag["data_type"] == "DINT"
         assert speed_tag["scope"] == "controller"
 
@@ -1234,15 +1317,14 @@ class TestGetScopeReferences:
             program_name="ValveProgram",
             routine_name="MainRoutine",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert data["summary"]["aoi_calls"] >= 2
         # Check AOI call details
         aoi_call = data["aoi_calls"][0]
         assert aoi_call["aoi_name"] == "VALVE_CTL"
         assert aoi_call["instance_tag"] == "V101"
         # Check parameter bindings
-        bindings = aoi_call["bindings"]
-        binding_names = [b["parameter"] for b in bindings]
+        binding_names = _names(aoi_call["bindings"], "parameter")
         assert "Command" in binding_names
         assert "IOArray" in binding_names
         assert "AddressOffset" in binding_names
@@ -1253,12 +1335,10 @@ class TestGetScopeReferences:
             routine_name="MainRoutine",
             rung_range="0",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         call = data["aoi_calls"][0]
         # Find the IOArray binding
-        io_binding = next(
-            b for b in call["bindings"] if b["parameter"] == "IOArray"
-        )
+        io_binding = _by(call["bindings"], "parameter")["IOArray"]
         assert io_binding["usage"] == "InOut"
         assert io_binding["required"] is True
         assert io_binding["wired_tag"] == "IO_Data"
@@ -1269,18 +1349,19 @@ class TestGetScopeReferences:
             routine_name="MainRoutine",
             include_tag_info=False,
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         # Tags should have name and rungs but no data_type
-        for t in data["tags"]:
-            assert "name" in t
-            assert "rungs" in t
-            assert "data_type" not in t
+        assert data["tags"]
+        assert all(
+            {"name", "rungs"} <= t.keys() and "data_type" not in t
+            for t in data["tags"]
+        )
 
     def test_scan_all_routines_in_program(self, rich_project):
         raw = mcp_server.get_scope_references(
             program_name="ValveProgram",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert data["summary"]["unique_tags"] > 0
 
 
@@ -1291,7 +1372,7 @@ class TestGetScopeReferences:
 class TestFindReferences:
     def test_single_tag(self, rich_project):
         raw = mcp_server.find_references('"GlobalRun"', entity_type="tag")
-        data = json.loads(raw)
+        data = _loads(raw)
         assert "GlobalRun" in data
         assert len(data["GlobalRun"]) >= 2  # used in rung 0 and 1
 
@@ -1299,7 +1380,7 @@ class TestFindReferences:
         raw = mcp_server.find_references(
             '["GlobalRun", "GlobalSpeed"]', entity_type="tag",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert "GlobalRun" in data
         assert "GlobalSpeed" in data
         assert len(data["GlobalRun"]) >= 2
@@ -1309,7 +1390,7 @@ class TestFindReferences:
         raw = mcp_server.find_references(
             '["VALVE_CTL"]', entity_type="aoi",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert "VALVE_CTL" in data
         assert len(data["VALVE_CTL"]) >= 2
 
@@ -1317,7 +1398,7 @@ class TestFindReferences:
         raw = mcp_server.find_references(
             '["VALVE_CTL"]', entity_type="udt",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert "VALVE_CTL" in data
         tag_names = [m["tag_name"] for m in data["VALVE_CTL"]]
         assert "V101" in tag_names
@@ -1333,7 +1414,7 @@ class TestFindReferences:
 
     def test_tag_not_found(self, rich_project):
         raw = mcp_server.find_references('"NonExistent"', entity_type="tag")
-        data = json.loads(raw)
+        data = _loads(raw)
         assert data["NonExistent"] == []
 
 
@@ -1344,7 +1425,7 @@ class TestFindReferences:
 class TestGetTagValues:
     def test_single_tag_value(self, rich_project):
         raw = mcp_server.get_tag_values('"GlobalSpeed"')
-        data = json.loads(raw)
+        data = _loads(raw)
         assert len(data) == 1
         assert data[0]["name"] == "GlobalSpeed"
         assert data[0]["value"] == 1750
@@ -1352,25 +1433,34 @@ class TestGetTagValues:
 
     def test_multiple_tags(self, rich_project):
         raw = mcp_server.get_tag_values('["GlobalRun", "GlobalSpeed"]')
-        data = json.loads(raw)
+        data = _loads(raw)
         assert len(data) == 2
-        names = {t["name"] for t in data}
+        names = _names(data)
         assert names == {"GlobalRun", "GlobalSpeed"}
 
     def test_name_filter_glob(self, rich_project):
         raw = mcp_server.get_tag_values(
             '[]', name_filter="Global*",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert len(data) >= 2
         for t in data:
             assert t["name"].startswith("Global")
 
+    @pytest.mark.parametrize("pattern", [
+        "GlobalRun", "Global*", "*Speed", "*obal*", "G?obal*", "[GL]*",
+        "*", "",
+    ])
+    def test_compile_glob_matches_fnmatch(self, pattern):
+        matches = mcp_server._compile_glob(pattern)
+        for name in ("GlobalRun", "GlobalSpeed", "LocalCmd", "V101", ""):
+            assert matches(name) == fnmatch.fnmatch(name, pattern)
+
     def test_include_members_structured(self, rich_project):
         raw = mcp_server.get_tag_values(
             '"V101"', include_members=True,
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert len(data) == 1
         assert "members" in data[0]
         assert isinstance(data[0]["members"], dict)
@@ -1381,9 +1471,9 @@ class TestGetTagValues:
             scope="",
             include_aoi_context=True,
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         # IO_Data is wired as IOArray parameter to VALVE_CTL
-        io_tag = next(t for t in data if t["name"] == "IO_Data")
+        io_tag = _by(data, "name")["IO_Data"]
         assert "aoi_context" in io_tag
         assert len(io_tag["aoi_context"]) >= 1
         ctx = io_tag["aoi_context"][0]
@@ -1395,7 +1485,7 @@ class TestGetTagValues:
         raw = mcp_server.get_tag_values(
             '"LocalCmd"', scope="program", program_name="ValveProgram",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert len(data) == 1
         assert data[0]["name"] == "LocalCmd"
 
@@ -1403,12 +1493,12 @@ class TestGetTagValues:
         raw = mcp_server.get_tag_values(
             '"GlobalRun"', scope="",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert data[0]["scope"] == "controller"
 
     def test_nonexistent_tag(self, rich_project):
         raw = mcp_server.get_tag_values('"NoSuchTag"')
-        data = json.loads(raw)
+        data = _loads(raw)
         assert "error" in data[0]
 
     def test_invalid_json(self, rich_project):
@@ -1423,13 +1513,13 @@ class TestGetTagValues:
 class TestDetectConflicts:
     def test_tag_shadowing(self, rich_project):
         raw = mcp_server.detect_conflicts(check="tag_shadowing")
-        data = json.loads(raw)
+        data = _loads(raw)
         shadows = data["tag_shadowing"]["shadows"]
         assert data["tag_shadowing"]["shadows_found"] >= 1
-        shadow_names = [s["tag_name"] for s in shadows]
-        assert "ShadowTag" in shadow_names
+        by_name = _by(shadows, "tag_name")
+        assert "ShadowTag" in by_name
         # Check the detail
-        shadow = next(s for s in shadows if s["tag_name"] == "ShadowTag")
+        shadow = by_name["ShadowTag"]
         assert shadow["program"] == "ValveProgram"
         assert shadow["controller_data_type"] == "DINT"
         assert shadow["program_data_type"] == "BOOL"
@@ -1437,25 +1527,25 @@ class TestDetectConflicts:
 
     def test_unused_tags(self, rich_project):
         raw = mcp_server.detect_conflicts(check="unused_tags")
-        data = json.loads(raw)
+        data = _loads(raw)
         unused = data["unused_tags"]
         assert "Unused_Ctrl" in unused["controller_tags"]
 
     def test_scope_duplicates(self, rich_project):
         raw = mcp_server.detect_conflicts(check="scope_duplicates")
-        data = json.loads(raw)
+        data = _loads(raw)
         dupes = data["scope_duplicates"]["duplicates"]
         # LocalCmd exists in both ValveProgram and AuxProgram
         assert data["scope_duplicates"]["duplicates_found"] >= 1
-        dupe_names = [d["tag_name"] for d in dupes]
-        assert "LocalCmd" in dupe_names
+        by_name = _by(dupes, "tag_name")
+        assert "LocalCmd" in by_name
         # Check consistency flag
-        local_dupe = next(d for d in dupes if d["tag_name"] == "LocalCmd")
+        local_dupe = by_name["LocalCmd"]
         assert local_dupe["types_consistent"] is True
 
     def test_all_checks(self, rich_project):
         raw = mcp_server.detect_conflicts(check="all")
-        data = json.loads(raw)
+        data = _loads(raw)
         assert "tag_shadowing" in data
         assert "unused_tags" in data
         assert "scope_duplicates" in data
@@ -1465,7 +1555,7 @@ class TestDetectConflicts:
     def test_unknown_check(self, rich_project):
         raw = mcp_server.detect_conflicts(check="bogus")
         # Should return empty result (no matching check name)
-        data = json.loads(raw)
+        data = _loads(raw)
         assert isinstance(data, dict)
 
 
@@ -1480,7 +1570,7 @@ class TestCompareTagInstances:
             data_type="VALVE_CTL",
             match_members_json='["AddressOffset"]',
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert data["data_type"] == "VALVE_CTL"
         assert data["match_members"] == ["AddressOffset"]
         assert data["total_instances"] >= 2
@@ -1491,15 +1581,6 @@ class TestCompareTagInstances:
         assert "V101" in names
         assert "V102" in names
 
-    def test_multi_member_match(self, rich_project):
-        """Match on both AddressOffset and Command (both are 0/5)."""
-        raw = mcp_server.compare_tag_instances(
-            data_type="VALVE_CTL",
-            match_members_json='["AddressOffset", "Command"]',
-        )
-        data = json.loads(raw)
-        assert data["groups_with_duplicates"] >= 1
-
     def test_with_rung_bindings_inout(self, rich_project):
         """IOArray is InOut — value comes from rung text, not decorated data."""
         raw = mcp_server.compare_tag_instances(
@@ -1507,7 +1588,7 @@ class TestCompareTagInstances:
             match_members_json='["IOArray", "AddressOffset"]',
             include_rung_bindings=True,
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert data["groups_with_duplicates"] >= 1
         group = data["groups"][0]
         names = [i["tag_name"] for i in group["instances"]]
@@ -1518,54 +1599,55 @@ class TestCompareTagInstances:
             assert inst["member_values"]["IOArray"] == "IO_Data"
             assert str(inst["member_values"]["AddressOffset"]) == "5"
 
-    def test_filter_members(self, rich_project):
-        """Pre-filter to only AddressOffset=5 instances."""
+    # total/groups are minimums, or exact counts when exact is True.
+    @pytest.mark.parametrize("kw,total,groups,exact,filter_applied", [
+        pytest.param(
+            # AddressOffset and Command are both 5/0 on V101 and V102
+            {"match_members_json": '["AddressOffset", "Command"]'},
+            2, 1, False, None,
+            id="multi_member_match",
+        ),
+        pytest.param(
+            # Pre-filter to only AddressOffset=5 instances
+            {"match_members_json": '["Command"]',
+             "filter_members_json": '{"AddressOffset": "5"}'},
+            2, 0, False, {"AddressOffset": "5"},
+            id="filter_members",
+        ),
+        pytest.param(
+            # Filter with a value no instance has
+            {"match_members_json": '["AddressOffset"]',
+             "filter_members_json": '{"AddressOffset": "999"}'},
+            0, 0, True, {"AddressOffset": "999"},
+            id="filter_excludes_non_matching",
+        ),
+        pytest.param(
+            # No tags of MyUDT exist, so nothing can group
+            {"data_type": "MyUDT", "match_members_json": '["Speed"]'},
+            0, 0, True, None,
+            id="no_instances",
+        ),
+        pytest.param(
+            # V101 and V102 are controller-scoped
+            {"match_members_json": '["AddressOffset"]', "scope": "controller"},
+            2, 0, False, None,
+            id="scope_filter_controller",
+        ),
+    ])
+    def test_compare(self, rich_project, kw, total, groups, exact,
+                     filter_applied):
         raw = mcp_server.compare_tag_instances(
-            data_type="VALVE_CTL",
-            match_members_json='["Command"]',
-            filter_members_json='{"AddressOffset": "5"}',
-        )
-        data = json.loads(raw)
-        assert data["filter_applied"] == {"AddressOffset": "5"}
-        assert data["total_instances"] >= 2
-
-    def test_filter_excludes_non_matching(self, rich_project):
-        """Filter with a value no instance has — should find nothing."""
-        raw = mcp_server.compare_tag_instances(
-            data_type="VALVE_CTL",
-            match_members_json='["AddressOffset"]',
-            filter_members_json='{"AddressOffset": "999"}',
-        )
-        data = json.loads(raw)
-        assert data["total_instances"] == 0
-        assert data["groups_with_duplicates"] == 0
-
-    def test_no_duplicates_when_values_differ(self, rich_project):
-        """If match members have unique values, no groups should appear."""
-        # V101 and V102 have the same Command value (0), but let's filter
-        # to ensure we test the "no match" path by using a member that
-        # would differ if values were different. Since both have Command=0,
-        # they will actually group. So let's test with an empty result by
-        # using a data type with no tags.
-        raw = mcp_server.compare_tag_instances(
-            data_type="MyUDT",
-            match_members_json='["Speed"]',
-        )
-        data = json.loads(raw)
-        # No tags of MyUDT exist, so total_instances should be 0
-        assert data["total_instances"] == 0
-        assert data["groups_with_duplicates"] == 0
-
-    def test_scope_filter_controller(self, rich_project):
-        """Filter to controller scope only."""
-        raw = mcp_server.compare_tag_instances(
-            data_type="VALVE_CTL",
-            match_members_json='["AddressOffset"]',
-            scope="controller",
-        )
-        data = json.loads(raw)
-        # V101 and V102 are controller-scoped
-        assert data["total_instances"] >= 2
+            **{"data_type": "VALVE_CTL", **kw}
+        )
+        data = _loads(raw)
+        if exact:
+            assert data["total_instances"] == total
+            assert data["groups_with_duplicates"] == groups
+        else:
+            assert data["total_instances"] >= total
+            assert data["groups_with_duplicates"] >= groups
+        if filter_applied is not None:
+            assert data["filter_applied"] == filter_applied
 
     def test_invalid_match_members_json(self, rich_project):
         """Bad JSON in match_members should return error."""
@@ -1581,7 +1663,7 @@ class TestCompareTagInstances:
             data_type="VALVE_CTL",
             match_members_json="[]",
         )
-        data = json.loads(raw)
+        data = _loads(raw)
         assert "Error" in data
 
     def test_invalid_filter_json(self, rich_project):
@@ -1592,3 +1674,37 @@ class TestCompareTagInstances:
             filter_members_json="not json",
         )
         assert "Error" in raw
+
+
+# ===================================================================
+# 19. Project loading
+# ===================================================================
+
+class TestLoadProject:
+    def test_load_from_file(self, export_dir):
+        fp = _export_path(export_dir)
+        with open(fp, "wb") as fh:
+            fh.write(b"\xef\xbb\xbf" + _MINIMAL_BYTES)
+        result = mcp_server.load_project(fp)
+        assert result.startswith("Loaded: TestCtrl ")
+        assert mcp_server._project_path == fp
+
+    def test_load_bytes_matches_file_summary(self, export_dir):
+        fp = _export_path(export_dir)
+        with open(fp, "wb") as fh:
+            fh.write(_MINIMAL_BYTES)
+        from_file = mcp_server.load_project(fp)
+        from_bytes = mcp_server.load_project_bytes(_MINIMAL_BYTES)
+        assert from_bytes == from_file
+        assert mcp_server._project_path is None
+
+    def test_load_bytes_has_no_default_save_path(self):
+        mcp_server.load_project_bytes(_MINIMAL_BYTES)
+        raw = mcp_server.save_project()
+        assert raw.startswith("Error: No file path specified")
+
+    def test_load_bytes_invalid_resets_state(self):
+        result = mcp_server.load_project_bytes(b"<NotL5X/>")
+        assert result.startswith("Error loading project")
+        assert mcp_server._project is None
+        assert mcp_server._project_path is None